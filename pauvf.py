@@ -1,11 +1,17 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox
+import tkinter.font as tkfont
 import zipfile
+import mmap
 import os
 import re
 import struct
 import threading
 import time
+import functools
+import multiprocessing
+import queue
+from concurrent.futures import ThreadPoolExecutor
 
 class Theme:
     BG_DARK = "#0a1f0a"
@@ -35,13 +41,19 @@ class UnityVersionExtractor:
     """Extracts Unity version from APK files"""
     
 
-    VERSION_PATTERNS = [
-        rb'(\d+\.\d+\.\d+[a-zA-Z]?\d*)',  # e.g., 2021.3.1f1
-        rb'Unity (\d+\.\d+\.\d+)',
-        rb'unity version[:\s]+(\d+\.\d+\.\d+[a-zA-Z]?\d*)',
-    ]
+    # Version strings like 2021.3.1f1 with a 20xx or single-digit major, not starting mid-number
+    _COMBINED_RE = re.compile(rb'(\d(?<![\d.]\d)(?:0\d\d)?\.\d+\.\d+[a-z]?\d*)')
+    # Unity 2017-2025 or the legacy 3.x-5.x releases
+    _VERSION_VALIDATE = re.compile(rb'^(?:20(?:1[7-9]|2[0-5])|[3-5])\.\d+\.\d+[a-z]?\d*$')
+    SCAN_LIMIT = 2_000_000
+    CHUNK_SIZE = 1 << 20
+    CHUNK_OVERLAP = 256
+    DEEP_SCAN_WORKERS = 4
+    DEEP_SCAN_BUDGET = 256 << 20
+    HEADER_SIZE = 128
+    BUNDLE_SIGNATURES = (b'UnityFS\x00', b'UnityWeb\x00', b'UnityRaw\x00')
     
-    TARGET_FILES = [
+    TARGET_FILES = (
         ('assets/bin/Data/globalgamemanagers', 'globalgamemanagers'),
         ('assets/bin/Data/data.unity3d', 'data.unity3d'),
         ('assets/bin/Data/level0', 'level0'),
@@ -49,9 +61,9 @@ class UnityVersionExtractor:
         ('lib/armeabi-v7a/libunity.so', 'libunity.so (ARM)'),
         ('lib/arm64-v8a/libunity.so', 'libunity.so (ARM64)'),
         ('lib/x86/libunity.so', 'libunity.so (x86)'),
-    ]
+    )
     
-    STEPS = [
+    STEPS = (
         ('validating', 'Validating APK file...', 5),
         ('opening', 'Opening APK archive...', 10),
         ('checking_unity', 'Checking for Unity signatures...', 15),
@@ -60,22 +72,28 @@ class UnityVersionExtractor:
         ('parsing', 'Parsing version info...', 70),
         ('deep_scan', 'Deep scanning assets...', 85),
         ('finalizing', 'Finalizing results...', 100),
-    ]
+    )
     
     @staticmethod
-    def extract_version(apk_path: str, progress_callback=None) -> dict:
-        """
-        Extract Unity version from an APK file.
-        Returns a dict with version info and metadata.
-        """
-        result = {
+    def empty_result() -> dict:
+        """Result dict for a scan that has found nothing yet"""
+        return {
             'success': False,
             'version': None,
             'source_file': None,
+            'source_name': None,
             'is_unity': False,
             'error': None,
             'details': []
         }
+    
+    @staticmethod
+    def extract_version(apk_path: str, progress_callback=None) -> dict:
+        """
+        Extract Unity version from an APK file.
+        Returns a dict with version info and metadata.
+        """
+        result = UnityVersionExtractor.empty_result()
         
         def update_progress(step_name, message, progress, file_name=None):
             """Update progress with step info"""
@@ -84,7 +102,6 @@ class UnityVersionExtractor:
                     progress_callback(message, progress, file_name)
                 else:
                     progress_callback(message, progress)
-            time.sleep(0.15) 
         
         try:
             update_progress('validating', '🔍 Validating APK file...', 5)
@@ -96,34 +113,33 @@ class UnityVersionExtractor:
             update_progress('opening', '📂 Opening APK archive...', 10)
             
             with zipfile.ZipFile(apk_path, 'r') as apk:
-                file_list = apk.namelist()
-                total_files = len(file_list)
+                name_to_info = apk.NameToInfo
                 
                 update_progress('checking_unity', '🎮 Checking for Unity signatures...', 15)
-                time.sleep(0.2)
                 
-                unity_indicators = [
+                unity_indicators = (
                     'assets/bin/Data/',
                     'lib/armeabi-v7a/libunity.so',
                     'lib/arm64-v8a/libunity.so',
                     'lib/x86/libunity.so',
                     'lib/x86_64/libunity.so',
-                ]
+                )
                 
-                for indicator in unity_indicators:
-                    if any(f.startswith(indicator) or f == indicator for f in file_list):
-                        result['is_unity'] = True
-                        result['details'].append(f"✓ Found Unity indicator: {indicator}")
-                        break
+                indicator = next((i for i in unity_indicators if i in name_to_info), None)
+                if indicator is None:
+                    match = next((f for f in name_to_info if f.startswith(unity_indicators)), None)
+                    indicator = match and next(i for i in unity_indicators if match.startswith(i))
+                if indicator:
+                    result['is_unity'] = True
+                    result['details'].append(f"✓ Found Unity indicator: {indicator}")
                 
                 if not result['is_unity']:
                     result['error'] = "This APK does not appear to be a Unity game"
                     return result
                 
                 update_progress('scanning_files', '📁 Scanning file structure...', 25)
-                time.sleep(0.2)
                 
-                target_files_found = [(f, n) for f, n in UnityVersionExtractor.TARGET_FILES if f in file_list]
+                target_files_found = [(f, n) for f, n in UnityVersionExtractor.TARGET_FILES if f in name_to_info]
                 total_targets = len(target_files_found)
                 
                 for i, (target, display_name) in enumerate(target_files_found):
@@ -131,41 +147,60 @@ class UnityVersionExtractor:
                     update_progress('extracting', f'📦 Extracting {display_name}...', progress, display_name)
                     
                     try:
-                        data = apk.read(target)
-                        
                         update_progress('parsing', f'🔎 Parsing {display_name}...', progress + 5, display_name)
-                        version = UnityVersionExtractor._find_version_in_data(data)
+                        version = UnityVersionExtractor._find_version_in_member(apk, target)
                         
                         if version:
                             update_progress('finalizing', '✅ Version found!', 100)
                             result['success'] = True
                             result['version'] = version
                             result['source_file'] = target
+                            result['source_name'] = os.path.basename(target)
                             return result
                     except Exception as e:
                         result['details'].append(f"⚠ Could not read {display_name}: {str(e)}")
                 
                 update_progress('deep_scan', '🔬 Deep scanning assets folder...', 75)
-                data_files = [f for f in file_list if f.startswith('assets/bin/Data/')]
-                scan_limit = min(20, len(data_files))
+                # Smallest members first, until DEEP_SCAN_BUDGET bytes would be read
+                candidates = sorted((info.file_size, name) for name, info in name_to_info.items()
+                                    if name.startswith('assets/bin/Data/'))
+                data_files = []
+                budget = UnityVersionExtractor.DEEP_SCAN_BUDGET
+                for size, file_path in candidates:
+                    if budget <= 0:
+                        break
+                    data_files.append(file_path)
+                    budget -= min(size, UnityVersionExtractor.SCAN_LIMIT)
+                scan_limit = len(data_files)
                 
-                for i, file_path in enumerate(data_files[:scan_limit]):
-                    file_name = os.path.basename(file_path)
-                    progress = 75 + int((i / scan_limit) * 20)
-                    update_progress('deep_scan', f'🔬 Scanning {file_name}...', progress, file_name)
-                    
-                    try:
-                        data = apk.read(file_path)
-                        version = UnityVersionExtractor._find_version_in_data(data)
-                        
-                        if version:
-                            update_progress('finalizing', '✅ Version found!', 100)
-                            result['success'] = True
-                            result['version'] = version
-                            result['source_file'] = file_path
-                            return result
-                    except:
-                        pass
+                handles = threading.local()
+                opened = []
+                try:
+                    with ThreadPoolExecutor(max_workers=UnityVersionExtractor.DEEP_SCAN_WORKERS) as pool:
+                        futures = {
+                            pool.submit(UnityVersionExtractor._read_and_scan,
+                                        apk_path, file_path, handles, opened): file_path
+                            for file_path in data_files
+                        }
+                        # In submission order, so the smallest matching member wins
+                        for i, (future, file_path) in enumerate(futures.items()):
+                            file_name = os.path.basename(file_path)
+                            progress = 75 + int((i / scan_limit) * 20)
+                            update_progress('deep_scan', f'🔬 Scanning {file_name}...', progress, file_name)
+                            
+                            version = future.result()
+                            if version:
+                                for pending in futures:
+                                    pending.cancel()
+                                update_progress('finalizing', '✅ Version found!', 100)
+                                result['success'] = True
+                                result['version'] = version
+                                result['source_file'] = file_path
+                                result['source_name'] = file_name
+                                return result
+                finally:
+                    for handle in opened:
+                        handle.close()
                 
                 update_progress('finalizing', '⚠️ Version not found', 100)
                 result['error'] = "Unity version could not be determined (file may be obfuscated)"
@@ -179,71 +214,279 @@ class UnityVersionExtractor:
         
         return result
     
+    @classmethod
+    def _read_and_scan(cls, apk_path: str, name: str, handles: threading.local, opened: list) -> str:
+        """Scan one member through the worker thread's own ZipFile handle (ZipFile is not thread-safe)"""
+        try:
+            apk = getattr(handles, 'apk', None)
+            if apk is None:
+                apk = handles.apk = zipfile.ZipFile(apk_path, 'r')
+                opened.append(apk)
+            return cls._find_version_in_member(apk, name)
+        except Exception:
+            return None
+    
+    @classmethod
+    def _find_version_in_member(cls, apk: zipfile.ZipFile, name: str) -> str:
+        """Search a ZIP member for a Unity version without reading it into memory"""
+        info = apk.getinfo(name)
+        if info.compress_type == zipfile.ZIP_STORED:
+            mapped = cls._map_stored_member(apk, info)
+            if mapped:
+                mapping, start = mapped
+                with mapping:
+                    return cls._find_version_in_data(mapping, start, start + info.file_size)
+        
+        version = cls._sniff_bundle_header(apk, info)
+        if version:
+            return version
+        with apk.open(info) as member:
+            return cls._find_version_in_stream(member)
+    
+    @classmethod
+    def _sniff_bundle_header(cls, apk: zipfile.ZipFile, info: zipfile.ZipInfo) -> str:
+        """Read a version from the first bytes of a compressed member without inflating the body"""
+        with apk.open(info) as member:
+            head = member.read(cls.HEADER_SIZE)
+        return cls._parse_bundle_header(head) or cls._parse_serialized_file_header(head)
+    
     @staticmethod
-    def _find_version_in_data(data: bytes) -> str:
-        """Search for Unity version string in binary data"""
-        unity_indices = []
-        search_term = b'Unity'
-        idx = 0
+    def _map_stored_member(apk: zipfile.ZipFile, info: zipfile.ZipInfo):
+        """Memory-map an uncompressed member, returning (mapping, data offset) or None"""
+        try:
+            apk.fp.seek(info.header_offset)
+            header = apk.fp.read(30)
+            if header[:4] != b'PK\x03\x04':
+                return None
+            name_len, extra_len = struct.unpack_from('<HH', header, 26)
+            data_offset = info.header_offset + 30 + name_len + extra_len
+            base = data_offset - data_offset % mmap.ALLOCATIONGRANULARITY
+            mapping = mmap.mmap(apk.fp.fileno(), data_offset - base + info.file_size,
+                                offset=base, access=mmap.ACCESS_READ)
+        except (AttributeError, OSError, ValueError):
+            return None
+        return mapping, data_offset - base
+    
+    @classmethod
+    def _find_version_in_stream(cls, stream) -> str:
+        """Search a file-like object chunk by chunk, keeping memory flat"""
+        block = stream.read(min(cls.CHUNK_SIZE, cls.SCAN_LIMIT))
+        remaining = cls.SCAN_LIMIT - len(block)
+        tail = b''
+        pos = 0
         while True:
-            idx = data.find(search_term, idx)
-            if idx == -1:
-                break
-            unity_indices.append(idx)
-            idx += 1
-        
-        for idx in unity_indices[:10]:
-            start = max(0, idx - 50)
-            end = min(len(data), idx + 200)
-            chunk = data[start:end]
-            for pattern in UnityVersionExtractor.VERSION_PATTERNS:
-                matches = re.findall(pattern, chunk, re.IGNORECASE)
-                for match in matches:
-                    version = match.decode('utf-8', errors='ignore')
-                    if UnityVersionExtractor._is_valid_unity_version(version):
-                        return version
-        for pattern in UnityVersionExtractor.VERSION_PATTERNS:
-            matches = re.findall(pattern, data[:500000], re.IGNORECASE)  # First 500KB
-            for match in matches:
-                version = match.decode('utf-8', errors='ignore')
-                if UnityVersionExtractor._is_valid_unity_version(version):
-                    return version
-        version_starts = [b'20', b'5.', b'4.', b'3.']
-        for vs in version_starts:
-            idx = 0
-            while True:
-                idx = data.find(vs, idx)
-                if idx == -1 or idx > 500000:
+            window = tail + block
+            # Matches starting in the trailing overlap are left to the next window
+            owned = max(len(window) - cls.CHUNK_OVERLAP, 0) if block else len(window)
+            for match in cls._COMBINED_RE.finditer(window, pos):
+                if match.start() >= owned:
                     break
-                try:
-                    end_idx = idx
-                    while end_idx < min(idx + 30, len(data)):
-                        if data[end_idx] == 0 or data[end_idx] < 32 or data[end_idx] > 126:
-                            break
-                        end_idx += 1
-                    
-                    if end_idx > idx + 5:
-                        potential = data[idx:end_idx].decode('utf-8', errors='ignore')
-                        if UnityVersionExtractor._is_valid_unity_version(potential):
-                            return potential
-                except:
-                    pass
-                idx += 1
+                version = match.group(1)
+                if cls._is_valid_unity_version(version):
+                    return version.decode('ascii')
+            
+            if not block:
+                return None
+            if owned:
+                # One byte before the deferred region is kept as lookbehind context
+                tail = window[owned - 1:]
+                pos = 1
+            else:
+                tail = window
+            block = stream.read(min(cls.CHUNK_SIZE, remaining)) if remaining > 0 else b''
+            remaining -= len(block)
+    
+    @classmethod
+    def _find_version_in_data(cls, data: bytes, start: int = 0, end: int = None) -> str:
+        """Search for Unity version string in data[start:end], reading nothing outside it"""
+        end = len(data) if end is None else min(end, len(data))
+        version = (cls._parse_bundle_header(data, start, end)
+                   or cls._parse_serialized_file_header(data, start, end))
+        if version:
+            return version
+        
+        # Only STORED members get the .rodata narrowing; compressed ones are streamed
+        rodata = cls._elf_rodata_range(data, start, end)
+        if rodata:
+            start, end = rodata
+        end = min(end, start + cls.SCAN_LIMIT)
+        
+        for match in cls._COMBINED_RE.finditer(data, start, end):
+            version = match.group(1)
+            if cls._is_valid_unity_version(version):
+                return version.decode('ascii')
         
         return None
     
+    @classmethod
+    def _parse_bundle_header(cls, data: bytes, start: int = 0, end: int = None) -> str:
+        """Read the engine version from an asset bundle header (UnityFS, UnityWeb, UnityRaw)"""
+        end = len(data) if end is None else end
+        signature = next((s for s in cls.BUNDLE_SIGNATURES
+                          if start + len(s) <= end and data[start:start + len(s)] == s), None)
+        if signature is None:
+            return None
+        
+        # Signature, u32 format version, then the player version ("5.x.x") and the engine version
+        offset = start + len(signature) + 4
+        for _ in range(2):
+            terminator = data.find(b'\x00', offset, min(offset + 32, end))
+            if terminator == -1:
+                return None
+            version = data[offset:terminator]
+            offset = terminator + 1
+        return version.decode('ascii') if cls._is_valid_unity_version(version) else None
+    
+    @classmethod
+    def _parse_serialized_file_header(cls, data: bytes, start: int = 0, end: int = None) -> str:
+        """Read the Unity version stored in a SerializedFile header (globalgamemanagers, level0...)"""
+        end = len(data) if end is None else end
+        if start + 12 > end:
+            return None
+        format_version, = struct.unpack_from('>I', data, start + 8)
+        # Format 22+ widened the size/offset fields, pushing the version string to byte 48
+        offset = start + (48 if format_version >= 22 else 20)
+        terminator = data.find(b'\x00', offset, min(offset + 32, end))
+        if terminator == -1:
+            return None
+        
+        version = data[offset:terminator]
+        return version.decode('ascii') if cls._is_valid_unity_version(version) else None
+    
     @staticmethod
-    def _is_valid_unity_version(version: str) -> bool:
-        """Check if a string looks like a valid Unity version"""
-        if not version or len(version) < 5 or len(version) > 20:
-            return False
-        valid_starts = ['2017', '2018', '2019', '2020', '2021', '2022', '2023', '2024', '2025', '5.', '4.', '3.']
-        if not any(version.startswith(vs) for vs in valid_starts):
-            return False
-        if '.' not in version:
-            return False
-        pattern = r'^\d{4}\.\d+\.\d+[a-zA-Z]?\d*$|^\d\.\d+\.\d+[a-zA-Z]?\d*$'
-        return bool(re.match(pattern, version))
+    def _elf_rodata_range(data: bytes, start: int = 0, end: int = None):
+        """Locate the .rodata section of an ELF image (libunity.so), returning (start, end) or None"""
+        end = len(data) if end is None else end
+        if start + 0x40 > end or data[start:start + 4] != b'\x7fELF':
+            return None
+        try:
+            endian = '<' if data[start + 5] == 1 else '>'
+            if data[start + 4] == 2:
+                shoff, = struct.unpack_from(endian + 'Q', data, start + 0x28)
+                shentsize, shnum, shstrndx = struct.unpack_from(endian + 'HHH', data, start + 0x3A)
+                section_fmt = endian + 'IIQQQQ'
+            else:
+                shoff, = struct.unpack_from(endian + 'I', data, start + 0x20)
+                shentsize, shnum, shstrndx = struct.unpack_from(endian + 'HHH', data, start + 0x2E)
+                section_fmt = endian + 'IIIIII'
+            
+            def section(index):
+                at = start + shoff + index * shentsize
+                if at + struct.calcsize(section_fmt) > end:
+                    raise IndexError(index)
+                return struct.unpack_from(section_fmt, data, at)
+            
+            names_offset = start + section(shstrndx)[4]
+            for i in range(shnum):
+                name, _, _, _, offset, size = section(i)
+                name_at = names_offset + name
+                if name_at + 8 <= end and data[name_at:name_at + 8] == b'.rodata\x00':
+                    rodata_start = start + offset
+                    rodata_end = min(rodata_start + size, end)
+                    return (rodata_start, rodata_end) if rodata_start < rodata_end else None
+        except (struct.error, IndexError):
+            pass
+        return None
+    
+    @classmethod
+    def _is_valid_unity_version(cls, version: bytes) -> bool:
+        """Check if raw bytes look like a valid Unity version (only accepted ones get decoded)"""
+        return 5 <= len(version) <= 20 and bool(cls._VERSION_VALIDATE.match(version))
+
+def _throttled(callback, interval=0.05):
+    """
+    Wrap a progress callback so repeats of the same percentage and file are sent
+    at most once per interval; a new percentage or file name always goes through.
+    """
+    last = [0.0, -1, None]
+    def throttled(message, progress, file_name=None):
+        now = time.monotonic()
+        percent = int(progress)
+        if percent == last[1] and file_name == last[2] and now - last[0] < interval:
+            return
+        last[0] = now
+        last[1] = percent
+        last[2] = file_name
+        callback(message, progress, file_name)
+    return throttled
+
+class _ScanState:
+    """Progress and result slots for one scan; a superseded worker keeps writing to its own"""
+    __slots__ = ('status', 'result')
+    
+    def __init__(self):
+        self.status = None
+        self.result = None
+
+def _scan_in_worker(apk_path, progress_queue, result_queue):
+    """Run extract_version in a worker process, sending progress and the result back on queues"""
+    def update_status(message, progress, file_name=None):
+        progress_queue.put((message, progress, file_name))
+    result_queue.put(UnityVersionExtractor.extract_version(apk_path, _throttled(update_status)))
+
+def _blend_static(rgb1, rgb2, alpha):
+    """Blend two winfo_rgb() triples without a Tk round-trip"""
+    r = int((rgb1[0] + (rgb2[0] - rgb1[0]) * alpha) / 256)
+    g = int((rgb1[1] + (rgb2[1] - rgb1[1]) * alpha) / 256)
+    b = int((rgb1[2] + (rgb2[2] - rgb1[2]) * alpha) / 256)
+    
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+def _hex_rgb(color):
+    """Expand "#rrggbb" to the 16-bit channels winfo_rgb() would return"""
+    return tuple(int(color[i:i + 2], 16) * 257 for i in (1, 3, 5))
+
+
+@functools.lru_cache(maxsize=512)
+def _blend_cached(color1, color2, alpha_q):
+    """Blend two "#rrggbb" colors at alpha_q percent (0-100), memoized across frames"""
+    return _blend_static(_hex_rgb(color1), _hex_rgb(color2), alpha_q / 100)
+
+
+class AnimationScheduler:
+    """Runs every widget animation from one shared Tk timer"""
+    
+    def __init__(self):
+        self._callbacks = []
+        self._owner = None
+        self._job = None
+    
+    def register(self, widget, callback):
+        """Call callback() once per frame until it returns a falsy value"""
+        if callback not in self._callbacks:
+            self._callbacks.append(callback)
+        if self._job is None:
+            self._owner = widget.winfo_toplevel()
+            self._job = self._owner.after(Theme.ANIMATION_SPEED, self._tick)
+    
+    def unregister(self, callback):
+        """Stop calling callback"""
+        if callback in self._callbacks:
+            self._callbacks.remove(callback)
+    
+    def _tick(self):
+        """Advance every registered animation by one frame"""
+        self._job = None
+        for callback in tuple(self._callbacks):
+            if callback not in self._callbacks:
+                continue
+            try:
+                running = callback()
+            except tk.TclError:
+                running = False
+            except Exception as e:
+                running = False
+                self._owner.report_callback_exception(type(e), e, e.__traceback__)
+            if not running:
+                self.unregister(callback)
+        
+        if self._callbacks and self._job is None:
+            self._job = self._owner.after(Theme.ANIMATION_SPEED, self._tick)
+
+
+_animations = AnimationScheduler()
+
 
 class RoundedFrame(tk.Canvas):
     """A frame with rounded corners"""
@@ -319,7 +562,7 @@ class GlowButton(tk.Canvas):
         self.hover = False
         self.glow_alpha = 0
         self.radius = 15
-        self.font_size = 12
+        self.font = tkfont.Font(root=self, family="Segoe UI", size=12, weight="bold")
         
         self._draw_button()
 
@@ -345,19 +588,29 @@ class GlowButton(tk.Canvas):
             bg = Theme.BUTTON_BG
             border = Theme.ACCENT_SECONDARY
 
-        if self.hover and self.glow_alpha > 0:
-            for i in range(3):
-                alpha = int(self.glow_alpha * (3 - i) / 3)
-                glow_color = self._blend_color(Theme.BG_DARK, Theme.ACCENT_GLOW, alpha / 255)
-                offset = (3 - i) * 2
-                self._draw_rounded_rect(offset, offset, w - offset * 2, h - offset * 2, 
-                                       r, glow_color, glow_color)
+        self._glow_ids = []
+        for i in range(3):
+            offset = (3 - i) * 2
+            self._glow_ids.append(self._draw_rounded_rect(offset, offset, w - offset * 2, h - offset * 2,
+                                                          r, "", ""))
+        self._update_glow()
 
         self._draw_rounded_rect(0, 0, w, h, r, bg, border)
 
-        font_size = getattr(self, 'font_size', 12)
         self.create_text(w // 2, h // 2, text=self.text, fill=Theme.TEXT_PRIMARY,
-                        font=("Segoe UI", font_size, "bold"), anchor="center")
+                        font=self.font, anchor="center")
+    
+    def _update_glow(self):
+        """Recolor the persistent glow rings for the current glow_alpha"""
+        if not (self.hover and self.glow_alpha > 0):
+            for glow_id in self._glow_ids:
+                self.itemconfig(glow_id, state="hidden")
+            return
+        
+        for i, glow_id in enumerate(self._glow_ids):
+            alpha = int(self.glow_alpha * (3 - i) / 3)
+            glow_color = _blend_cached(Theme.BG_DARK, Theme.ACCENT_GLOW, round(alpha * 100 / 255))
+            self.itemconfig(glow_id, fill=glow_color, outline=glow_color, state="normal")
     
     def _draw_rounded_rect(self, x, y, w, h, r, fill, outline):
         """Draw a single rounded rectangle"""
@@ -375,45 +628,34 @@ class GlowButton(tk.Canvas):
             x, y + r,
             x, y,
         ]
-        self.create_polygon(points, smooth=True, fill=fill, outline=outline, width=2)
-    
-    def _blend_color(self, color1, color2, alpha):
-        """Blend two colors"""
-        c1 = self.winfo_rgb(color1)
-        c2 = self.winfo_rgb(color2)
-        
-        r = int((c1[0] * (1 - alpha) + c2[0] * alpha) / 256)
-        g = int((c1[1] * (1 - alpha) + c2[1] * alpha) / 256)
-        b = int((c1[2] * (1 - alpha) + c2[2] * alpha) / 256)
-        
-        return f"#{r:02x}{g:02x}{b:02x}"
+        return self.create_polygon(points, smooth=True, fill=fill, outline=outline, width=2)
     
     def _on_enter(self, event):
         self.hover = True
+        self._draw_button()
         self._animate_glow(True)
     
     def _on_leave(self, event):
         self.hover = False
+        self._draw_button()
         self._animate_glow(False)
     
     def _animate_glow(self, fade_in):
         """Animate the glow effect"""
-        target = 100 if fade_in else 0
-        step = 10 if fade_in else -10
-        
-        def animate():
-            self.glow_alpha += step
-            if fade_in:
-                self.glow_alpha = min(self.glow_alpha, target)
-            else:
-                self.glow_alpha = max(self.glow_alpha, target)
-            
-            self._draw_button()
-            
-            if self.glow_alpha != target:
-                self.after(Theme.ANIMATION_SPEED, animate)
+        self._glow_target = 100 if fade_in else 0
+        self._glow_step = 10 if fade_in else -10
+        _animations.register(self, self._glow_frame)
+    
+    def _glow_frame(self):
+        """Move the glow one step toward its target"""
+        self.glow_alpha += self._glow_step
+        if self._glow_step > 0:
+            self.glow_alpha = min(self.glow_alpha, self._glow_target)
+        else:
+            self.glow_alpha = max(self.glow_alpha, self._glow_target)
         
-        animate()
+        self._update_glow()
+        return self.glow_alpha != self._glow_target
     
     def _on_click(self, event):
         self._draw_button(pressed=True)
@@ -428,7 +670,7 @@ class GlowButton(tk.Canvas):
         self.width = width
         self.height = height
         self.radius = min(15, height // 3)
-        self.font_size = font_size
+        self.font.configure(size=font_size)
         self.config(width=width, height=height)
         self._draw_button()
 
@@ -439,28 +681,23 @@ class AnimatedLabel(tk.Label):
     def __init__(self, parent, **kwargs):
         self.target_fg = kwargs.pop('fg', Theme.TEXT_PRIMARY)
         super().__init__(parent, fg=Theme.BG_DARK, **kwargs)
+        
+        steps = Theme.FADE_STEPS
+        bg_rgb = self.winfo_rgb(Theme.BG_DARK)
+        fg_rgb = self.winfo_rgb(self.target_fg)
+        self._fade_palette = [_blend_static(bg_rgb, fg_rgb, i / steps) for i in range(steps + 1)]
         self._fade_in()
     
     def _fade_in(self):
         """Animate text fading in"""
-        steps = Theme.FADE_STEPS
-        
-        def get_color(step):
-            bg_rgb = self.winfo_rgb(Theme.BG_DARK)
-            fg_rgb = self.winfo_rgb(self.target_fg)
-            
-            r = int((bg_rgb[0] + (fg_rgb[0] - bg_rgb[0]) * step / steps) / 256)
-            g = int((bg_rgb[1] + (fg_rgb[1] - bg_rgb[1]) * step / steps) / 256)
-            b = int((bg_rgb[2] + (fg_rgb[2] - bg_rgb[2]) * step / steps) / 256)
-            
-            return f"#{r:02x}{g:02x}{b:02x}"
-        
-        def animate(step=0):
-            if step <= steps:
-                self.config(fg=get_color(step))
-                self.after(Theme.ANIMATION_SPEED, lambda: animate(step + 1))
-        
-        self.after(100, animate)
+        self._fade_step = 0
+        self.after(100, lambda: _animations.register(self, self._fade_frame))
+    
+    def _fade_frame(self):
+        """Show the next color of the fade"""
+        self.config(fg=self._fade_palette[self._fade_step])
+        self._fade_step += 1
+        return self._fade_step < len(self._fade_palette)
     
     def set_text(self, text):
         """Set text with animation"""
@@ -470,6 +707,8 @@ class AnimatedLabel(tk.Label):
 class PulsingDot(tk.Canvas):
     """A pulsing dot indicator"""
     
+    PULSE_FRAMES = max(1, round(Theme.PULSE_SPEED / Theme.ANIMATION_SPEED))
+    
     def __init__(self, parent, size=10, **kwargs):
         super().__init__(parent, width=size * 3, height=size * 3,
                         bg=Theme.BG_DARK, highlightthickness=0, **kwargs)
@@ -478,21 +717,36 @@ class PulsingDot(tk.Canvas):
         self.pulse_value = 0
         self.pulse_direction = 1
         self.running = False
+        
+        # Ring colors for every pulse_value (0-100 in steps of 5), outermost ring first
+        bg_rgb = self.winfo_rgb(Theme.BG_DARK)
+        fg_rgb = self.winfo_rgb(Theme.ACCENT_PRIMARY)
+        self._ring_palette = [
+            tuple(_blend_static(bg_rgb, fg_rgb, (value / 100) * (4 - i) / 3 * 0.5) for i in range(3, 0, -1))
+            for value in range(0, 101, 5)
+        ]
     
     def start(self):
         """Start the pulsing animation"""
         self.running = True
-        self._pulse()
+        self._pulse_frame = 0
+        _animations.register(self, self._pulse)
     
     def stop(self):
         """Stop the animation"""
         self.running = False
+        _animations.unregister(self._pulse)
         self.delete("all")
     
     def _pulse(self):
-        """Animate the pulse"""
+        """Animate the pulse, advancing once every PULSE_FRAMES shared frames"""
         if not self.running:
-            return
+            return False
+        
+        frame = self._pulse_frame
+        self._pulse_frame += 1
+        if frame % self.PULSE_FRAMES:
+            return True
         
         self.delete("all")
 
@@ -502,10 +756,9 @@ class PulsingDot(tk.Canvas):
         elif self.pulse_value <= 0:
             self.pulse_direction = 1
 
-        for i in range(3, 0, -1):
-            alpha = (self.pulse_value / 100) * (4 - i) / 3
+        colors = self._ring_palette[self.pulse_value // 5]
+        for i, color in zip(range(3, 0, -1), colors):
             radius = self.size + i * 2
-            color = self._get_alpha_color(Theme.ACCENT_PRIMARY, alpha * 0.5)
             cx, cy = self.size * 1.5, self.size * 1.5
             self.create_oval(cx - radius, cy - radius, cx + radius, cy + radius,
                            fill=color, outline="")
@@ -514,24 +767,14 @@ class PulsingDot(tk.Canvas):
         self.create_oval(cx - self.size/2, cy - self.size/2, 
                         cx + self.size/2, cy + self.size/2,
                         fill=Theme.ACCENT_PRIMARY, outline="")
-        
-        self.after(Theme.PULSE_SPEED, self._pulse)
-    
-    def _get_alpha_color(self, color, alpha):
-        """Get a color with alpha blended against background"""
-        bg_rgb = self.winfo_rgb(Theme.BG_DARK)
-        fg_rgb = self.winfo_rgb(color)
-        
-        r = int((bg_rgb[0] * (1 - alpha) + fg_rgb[0] * alpha) / 256)
-        g = int((bg_rgb[1] * (1 - alpha) + fg_rgb[1] * alpha) / 256)
-        b = int((bg_rgb[2] * (1 - alpha) + fg_rgb[2] * alpha) / 256)
-        
-        return f"#{r:02x}{g:02x}{b:02x}"
+        return True
 
 
 class ProgressBar(tk.Canvas):
     """Animated progress bar with smooth transitions"""
     
+    GRADIENT_WIDTH = 120
+    
     def __init__(self, parent, width=400, height=10, **kwargs):
         super().__init__(parent, width=width, height=height,
                         bg=Theme.BG_DARK, highlightthickness=0, **kwargs)
@@ -545,54 +788,78 @@ class ProgressBar(tk.Canvas):
         self.animating = False
         self.radius = height // 2
         
+        self._create_items()
         self._draw()
     
+    def _create_items(self):
+        """Create the persistent canvas items that _draw repositions each frame"""
+        self._track_ids = self._create_rounded_bar(Theme.BG_LIGHT)
+        self._glow_id = self.create_rectangle(0, 0, 0, 0, outline="", tags="fill",
+                                              fill=self._blend(Theme.BG_DARK, Theme.ACCENT_GLOW, 0.15))
+        self._fill_ids = self._create_rounded_bar(Theme.ACCENT_PRIMARY, "fill")
+        self._shine_id = self.create_rectangle(0, 0, 0, 0, outline="", tags="fill",
+                                               fill=self._blend(Theme.ACCENT_PRIMARY, "#ffffff", 0.3))
+        self._gradient_img = tk.PhotoImage(master=self)
+        self._grad_item = self.create_image(0, 1, image=self._gradient_img, anchor="nw", state="hidden")
+        self._render_gradient()
+        self._place_rounded_bar(self._track_ids, 0, self.bar_width)
+    
+    def _render_gradient(self):
+        """Render the indeterminate gradient segment into its image once per bar height"""
+        seg_width = self.GRADIENT_WIDTH
+        rows = max(self.bar_height - 2, 1)
+        colors = [self._blend(Theme.BG_LIGHT, Theme.ACCENT_PRIMARY, (i / seg_width) ** 0.5)
+                  for i in range(seg_width)]
+        row = "{" + " ".join(colors) + "}"
+        self._gradient_img.blank()
+        self._gradient_img.configure(width=seg_width, height=rows)
+        self._gradient_img.put(" ".join([row] * rows))
+    
+    def _create_rounded_bar(self, color, tags=()):
+        """Create the rectangle and two end caps of a rounded bar"""
+        return (
+            self.create_rectangle(0, 0, 0, 0, fill=color, outline="", tags=tags),
+            self.create_oval(0, 0, 0, 0, fill=color, outline="", tags=tags),
+            self.create_oval(0, 0, 0, 0, fill=color, outline="", tags=tags),
+        )
+    
+    def _place_rounded_bar(self, ids, start_x, end_x):
+        """Move a rounded bar to span start_x..end_x"""
+        h = self.bar_height
+        rect, left_cap, right_cap = ids
+        if end_x - start_x < 4:
+            self.coords(rect, start_x, 0, end_x, h)
+            self.itemconfig(left_cap, state="hidden")
+            self.itemconfig(right_cap, state="hidden")
+        else:
+            self.coords(rect, start_x + 2, 0, end_x - 2, h)
+            self.coords(left_cap, start_x, 0, start_x + h, h)
+            self.coords(right_cap, end_x - h, 0, end_x, h)
+    
     def _draw(self):
-        """Draw the progress bar with rounded corners"""
-        self.delete("all")
-        
+        """Update the progress bar items for the current state"""
         h = self.bar_height
-        r = self.radius
-        
-        self._draw_rounded_bar(0, self.bar_width, Theme.BG_LIGHT)
         
         if self.indeterminate:
-            seg_width = 120
-            x1 = self.ind_pos - seg_width
-            x2 = self.ind_pos
-
-            for i in range(seg_width):
-                alpha = (i / seg_width) ** 0.5 
-                color = self._blend(Theme.BG_LIGHT, Theme.ACCENT_PRIMARY, alpha)
-                x = x1 + i
-                if 0 <= x < self.bar_width:
-                    self.create_line(x, 1, x, h - 1, fill=color, width=1)
-        else:
-            fill_width = int(self.bar_width * self.progress / 100)
-                for i in range(3):
-                    glow_alpha = 0.15 * (3 - i)
-                    glow_color = self._blend(Theme.BG_DARK, Theme.ACCENT_GLOW, glow_alpha)
-                    offset = i + 1
-                    self.create_rectangle(0, -offset, fill_width, h + offset,
-                                         fill=glow_color, outline="")
-                
-                self._draw_rounded_bar(0, fill_width, Theme.ACCENT_PRIMARY)
-                
-                if fill_width > 10:
-                    shine_x = fill_width - 5
-                    self.create_rectangle(shine_x, 2, fill_width - 2, h - 2,
-                                         fill=self._blend(Theme.ACCENT_PRIMARY, "#ffffff", 0.3),
-                                         outline="")
-    
-    def _draw_rounded_bar(self, start_x, end_x, color):
-        """Draw a rounded bar segment"""
-        h = self.bar_height
-        if end_x - start_x < 4:
-            self.create_rectangle(start_x, 0, end_x, h, fill=color, outline="")
+            self.itemconfig("fill", state="hidden")
+            self.itemconfig(self._grad_item, state="normal")
+            self.coords(self._grad_item, self.ind_pos - self.GRADIENT_WIDTH, 1)
+            return
+        
+        self.itemconfig(self._grad_item, state="hidden")
+        fill_width = int(self.bar_width * self.progress / 100)
+        if fill_width <= 0:
+            self.itemconfig("fill", state="hidden")
+            return
+        
+        self.itemconfig("fill", state="normal")
+        self.coords(self._glow_id, 0, -3, fill_width, h + 3)
+        self._place_rounded_bar(self._fill_ids, 0, fill_width)
+        
+        if fill_width > 10:
+            self.coords(self._shine_id, fill_width - 5, 2, fill_width - 2, h - 2)
         else:
-            self.create_rectangle(start_x + 2, 0, end_x - 2, h, fill=color, outline="")
-            self.create_oval(start_x, 0, start_x + h, h, fill=color, outline="")
-            self.create_oval(end_x - h, 0, end_x, h, fill=color, outline="")
+            self.itemconfig(self._shine_id, state="hidden")
     
     def _blend(self, c1, c2, alpha):
         """Blend two colors"""
@@ -630,38 +897,42 @@ class ProgressBar(tk.Canvas):
             return
         
         self.animating = True
+        _animations.register(self, self._progress_frame)
+    
+    def _progress_frame(self):
+        """Ease the fill one frame toward target_progress"""
+        if not self.animating:
+            return False
         
-        def animate():
-            if abs(self.progress - self.target_progress) < 1:
-                self.progress = self.target_progress
-                self._draw()
-                self.animating = False
-                return
-            
-            diff = self.target_progress - self.progress
-            self.progress += diff * 0.2
+        if abs(self.progress - self.target_progress) < 1:
+            self.progress = self.target_progress
             self._draw()
-            self.after(16, animate)
+            self.animating = False
+            return False
         
-        animate()
+        diff = self.target_progress - self.progress
+        self.progress += diff * 0.2
+        self._draw()
+        return True
     
     def start_indeterminate(self):
         """Start indeterminate animation"""
         self.indeterminate = True
         self.animating = False
-        self._animate_indeterminate()
+        self._draw()
+        _animations.register(self, self._animate_indeterminate)
     
     def _animate_indeterminate(self):
         """Animate indeterminate mode"""
         if not self.indeterminate:
-            return
+            return False
         
         self.ind_pos += 6
-        if self.ind_pos > self.bar_width + 120:
+        if self.ind_pos > self.bar_width + self.GRADIENT_WIDTH:
             self.ind_pos = 0
         
-        self._draw()
-        self.after(16, self._animate_indeterminate)
+        self.coords(self._grad_item, self.ind_pos - self.GRADIENT_WIDTH, 1)
+        return True
     
     def stop(self):
         """Stop animation and reset"""
@@ -677,6 +948,8 @@ class ProgressBar(tk.Canvas):
         self.bar_height = height
         self.radius = height // 2
         self.config(width=width, height=height)
+        self._place_rounded_bar(self._track_ids, 0, self.bar_width)
+        self._render_gradient()
         self._draw()
 
 class PAUVFApp:
@@ -687,6 +960,23 @@ class PAUVFApp:
     MIN_WIDTH = 450
     MIN_HEIGHT = 400
     
+    RESULT_FLASH = ("#ffffff", Theme.ACCENT_PRIMARY) * 3
+    PERCENT_STR = tuple(f"{i}%" for i in range(101))
+    # Font name -> (family, base size, weight)
+    FONTS = {
+        "title": ("Consolas", 32, "bold"),
+        "subtitle": ("Segoe UI", 12, "normal"),
+        "icon": ("Segoe UI Emoji", 40, "normal"),
+        "file": ("Segoe UI", 11, "normal"),
+        "percent": ("Consolas", 11, "bold"),
+        "status": ("Segoe UI", 10, "normal"),
+        "current_file": ("Consolas", 9, "normal"),
+        "result": ("Consolas", 14, "normal"),
+        "small": ("Segoe UI", 9, "normal"),
+    }
+    # APKs at least this large are scanned in a worker process instead of a thread
+    PROCESS_SCAN_MIN_SIZE = 64 << 20
+    
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("PAUVF - Procz APK Unity Version Finder")
@@ -700,9 +990,42 @@ class PAUVFApp:
         self.current_scale = 1.0
         self.last_width = self.BASE_WIDTH
         self.last_height = self.BASE_HEIGHT
+        self._title_ramp = tuple(
+            self._blend_color(Theme.ACCENT_SECONDARY, Theme.ACCENT_PRIMARY, abs(10 - step) / 10)
+            for step in range(20)
+        )
+        self._fonts = {
+            name: tkfont.Font(root=self.root, family=family, size=size, weight=weight)
+            for name, (family, size, weight) in self.FONTS.items()
+        }
         self._create_ui()
+        self._status_set = self._status_var.set
+        self._progress_set = self.progress_bar.set_progress
+        self._percent_set = self._pct_var.set
+        self._current_config = self.current_file_label.config
+        self._scan = None
+        self._applied_status = None
+        # after() ids of the running intro and result animations
+        self._intro_job = None
+        self._flash_job = None
+        # Worker process and queues of the current large-APK scan
+        self._mp_context = multiprocessing.get_context("spawn")
+        self._scan_process = None
+        self._progress_queue = None
+        self._result_queue = None
         self._animate_intro()
         self.root.bind('<Configure>', self._on_resize)
+        self.root.after(50, self._drain_status)
+        self.root.after(200, self._prewarm_dialog)
+    
+    def _prewarm_dialog(self):
+        """Source the Tk file dialog (tkfbox.tcl) ahead of the first click, without showing it"""
+        # Windows and macOS use native dialogs, so only X11 has Tcl code left to load
+        try:
+            if self.root.tk.call("tk", "windowingsystem") == "x11":
+                self.root.tk.call("auto_load", "::tk::dialog::file::")
+        except tk.TclError:
+            pass
     
     def _get_scale(self):
         """Calculate current scale factor based on window size"""
@@ -734,17 +1057,9 @@ class PAUVFApp:
     def _update_scaling(self):
         """Update all UI elements with new scale"""
         scale = self.current_scale
-        self.title_label.config(font=("Consolas", self._scale_font(32), "bold"))
-        self.subtitle_label.config(font=("Segoe UI", self._scale_font(12)))
-        self.file_icon.config(font=("Segoe UI Emoji", self._scale_font(40)))
-        self.file_label.config(font=("Segoe UI", self._scale_font(11)))
-        self.progress_percent_label.config(font=("Consolas", self._scale_font(11), "bold"))
-        self.status_label.config(font=("Segoe UI", self._scale_font(10)))
-        self.current_file_label.config(font=("Consolas", self._scale_font(9)))
-        self.result_label.config(font=("Consolas", self._scale_font(14)))
-        self.details_label.config(font=("Segoe UI", self._scale_font(9)),
-                                  wraplength=int(500 * scale))
-        self.footer.config(font=("Segoe UI", self._scale_font(9)))
+        for name, (_, size, _) in self.FONTS.items():
+            self._fonts[name].configure(size=self._scale_font(size))
+        self.details_label.config(wraplength=int(500 * scale))
         new_bar_width = int(450 * scale)
         new_bar_height = max(8, int(12 * scale))
         self.progress_bar.resize(new_bar_width, new_bar_height)
@@ -760,151 +1075,83 @@ class PAUVFApp:
     
     def _create_ui(self):
         """Create the main UI"""
-        self.main_frame = tk.Frame(self.root, bg=Theme.BG_DARK)
-        self.main_frame.pack(fill="both", expand=True, padx=30, pady=30)
-        self.header_frame = tk.Frame(self.main_frame, bg=Theme.BG_DARK)
-        self.header_frame.pack(fill="x", pady=(0, 20))
-        self.title_label = tk.Label(
-            self.header_frame,
-            text="🎮 PAUVF",
-            font=("Consolas", 32, "bold"),
-            fg=Theme.ACCENT_PRIMARY,
-            bg=Theme.BG_DARK
-        )
-        self.title_label.pack()
-        
-        self.subtitle_label = tk.Label(
-            self.header_frame,
-            text="Procz APK Unity Version Finder",
-            font=("Segoe UI", 12),
-            fg=Theme.TEXT_SECONDARY,
-            bg=Theme.BG_DARK
-        )
-        self.subtitle_label.pack(pady=(5, 0))
-        self.line_canvas = tk.Canvas(
-            self.header_frame, 
-            width=400, height=3,
-            bg=Theme.BG_DARK, 
-            highlightthickness=0
-        )
-        self.line_canvas.pack(pady=15)
+        self._pct_var = tk.StringVar(master=self.root, value="")
+        self._status_var = tk.StringVar(master=self.root, value="")
+        fonts = self._fonts
+        dark = {"bg": Theme.BG_DARK}
+        medium = {"bg": Theme.BG_MEDIUM}
+        # (attribute, widget class, parent attribute, widget options, pack options), in pack order
+        widgets = [
+            ("main_frame", tk.Frame, "root", dark, {"fill": "both", "expand": True, "padx": 30, "pady": 30}),
+            ("header_frame", tk.Frame, "main_frame", dark, {"fill": "x", "pady": (0, 20)}),
+            ("title_label", tk.Label, "header_frame",
+             {"text": "🎮 PAUVF", "font": fonts["title"], "fg": Theme.ACCENT_PRIMARY, **dark}, {}),
+            ("subtitle_label", tk.Label, "header_frame",
+             {"text": "Procz APK Unity Version Finder", "font": fonts["subtitle"], "fg": Theme.TEXT_SECONDARY,
+              **dark}, {"pady": (5, 0)}),
+            ("line_canvas", tk.Canvas, "header_frame",
+             {"width": 400, "height": 3, "highlightthickness": 0, **dark}, {"pady": 15}),
+            ("content_frame", tk.Frame, "main_frame", dark, {"fill": "both", "expand": True}),
+            ("file_frame", tk.Frame, "content_frame",
+             {"highlightbackground": Theme.BORDER_COLOR, "highlightthickness": 2, **medium},
+             {"fill": "x", "pady": 10, "ipady": 20, "ipadx": 20}),
+            ("file_icon", tk.Label, "file_frame",
+             {"text": "📦", "font": fonts["icon"], **medium}, {"pady": (10, 5)}),
+            ("file_label", tk.Label, "file_frame",
+             {"text": "No APK file selected", "font": fonts["file"], "fg": Theme.TEXT_MUTED, **medium}, {}),
+            ("button_frame", tk.Frame, "content_frame", dark, {"pady": 20}),
+            ("select_button", GlowButton, "button_frame",
+             {"text": "📂 SELECT APK FILE", "command": self._select_file, "width": 250, "height": 50}, {}),
+            ("status_frame", tk.Frame, "content_frame", dark, {"fill": "x", "pady": 10}),
+            ("progress_percent_label", tk.Label, "status_frame",
+             {"textvariable": self._pct_var, "font": fonts["percent"], "fg": Theme.ACCENT_PRIMARY, **dark},
+             {"pady": (0, 5)}),
+            ("progress_bar", ProgressBar, "status_frame", {"width": 450, "height": 12}, {"pady": 5}),
+            ("status_label", tk.Label, "status_frame",
+             {"textvariable": self._status_var, "font": fonts["status"], "fg": Theme.TEXT_SECONDARY, **dark},
+             {"pady": (5, 0)}),
+            ("current_file_label", tk.Label, "status_frame",
+             {"text": "", "font": fonts["current_file"], "fg": Theme.TEXT_MUTED, **dark}, {}),
+            ("result_frame", tk.Frame, "content_frame", dark, {"fill": "both", "expand": True, "pady": 10}),
+            ("result_label", tk.Label, "result_frame",
+             {"text": "", "font": fonts["result"], "fg": Theme.ACCENT_PRIMARY, "justify": "center", **dark},
+             {"pady": 10}),
+            ("details_label", tk.Label, "result_frame",
+             {"text": "", "font": fonts["small"], "fg": Theme.TEXT_MUTED, "justify": "center",
+              "wraplength": 500, **dark}, {}),
+            ("footer", tk.Label, "main_frame",
+             {"text": "Made with 💚 by Procz", "font": fonts["small"], "fg": Theme.TEXT_MUTED, **dark},
+             {"side": "bottom", "pady": (10, 0)}),
+        ]
+        
+        for name, cls, parent, options, pack_options in widgets:
+            widget = cls(getattr(self, parent), **options)
+            widget.pack(**pack_options)
+            setattr(self, name, widget)
+        
         self.line_canvas.create_rectangle(0, 0, 400, 3, fill=Theme.ACCENT_SECONDARY, outline="")
-        self.content_frame = tk.Frame(self.main_frame, bg=Theme.BG_DARK)
-        self.content_frame.pack(fill="both", expand=True)
-        self.file_frame = tk.Frame(self.content_frame, bg=Theme.BG_MEDIUM, 
-                                  highlightbackground=Theme.BORDER_COLOR,
-                                  highlightthickness=2)
-        self.file_frame.pack(fill="x", pady=10, ipady=20, ipadx=20)
-        
-        self.file_icon = tk.Label(
-            self.file_frame,
-            text="📦",
-            font=("Segoe UI Emoji", 40),
-            bg=Theme.BG_MEDIUM
-        )
-        self.file_icon.pack(pady=(10, 5))
-        
-        self.file_label = tk.Label(
-            self.file_frame,
-            text="No APK file selected",
-            font=("Segoe UI", 11),
-            fg=Theme.TEXT_MUTED,
-            bg=Theme.BG_MEDIUM
-        )
-        self.file_label.pack()
-        self.button_frame = tk.Frame(self.content_frame, bg=Theme.BG_DARK)
-        self.button_frame.pack(pady=20)
-        
-        self.select_button = GlowButton(
-            self.button_frame,
-            text="📂 SELECT APK FILE",
-            command=self._select_file,
-            width=250,
-            height=50
-        )
-        self.select_button.pack()
-        self.status_frame = tk.Frame(self.content_frame, bg=Theme.BG_DARK)
-        self.status_frame.pack(fill="x", pady=10)
-        self.progress_percent_label = tk.Label(
-            self.status_frame,
-            text="",
-            font=("Consolas", 11, "bold"),
-            fg=Theme.ACCENT_PRIMARY,
-            bg=Theme.BG_DARK
-        )
-        self.progress_percent_label.pack(pady=(0, 5))
-        self.progress_bar = ProgressBar(self.status_frame, width=450, height=12)
-        self.progress_bar.pack(pady=5)
-        self.status_label = tk.Label(
-            self.status_frame,
-            text="",
-            font=("Segoe UI", 10),
-            fg=Theme.TEXT_SECONDARY,
-            bg=Theme.BG_DARK
-        )
-        self.status_label.pack(pady=(5, 0))
-        self.current_file_label = tk.Label(
-            self.status_frame,
-            text="",
-            font=("Consolas", 9),
-            fg=Theme.TEXT_MUTED,
-            bg=Theme.BG_DARK
-        )
-        self.current_file_label.pack()
-        self.result_frame = tk.Frame(self.content_frame, bg=Theme.BG_DARK)
-        self.result_frame.pack(fill="both", expand=True, pady=10)
-        
-        self.result_label = tk.Label(
-            self.result_frame,
-            text="",
-            font=("Consolas", 14),
-            fg=Theme.ACCENT_PRIMARY,
-            bg=Theme.BG_DARK,
-            justify="center"
-        )
-        self.result_label.pack(pady=10)
-        
-        self.details_label = tk.Label(
-            self.result_frame,
-            text="",
-            font=("Segoe UI", 9),
-            fg=Theme.TEXT_MUTED,
-            bg=Theme.BG_DARK,
-            justify="center",
-            wraplength=500
-        )
-        self.details_label.pack()
-        self.footer = tk.Label(
-            self.main_frame,
-            text="Made with 💚 by Procz",
-            font=("Segoe UI", 9),
-            fg=Theme.TEXT_MUTED,
-            bg=Theme.BG_DARK
-        )
-        self.footer.pack(side="bottom", pady=(10, 0))
     
     def _animate_intro(self):
         """Play intro animation"""
-        def pulse_title(step=0):
-            if step < 20:
-                alpha = abs(10 - step) / 10
-                color = self._blend_color(Theme.ACCENT_SECONDARY, Theme.ACCENT_PRIMARY, alpha)
-                self.title_label.config(fg=color)
-                self.root.after(50, lambda: pulse_title(step + 1))
-            else:
-                self.title_label.config(fg=Theme.ACCENT_PRIMARY)
-        
-        self.root.after(500, pulse_title)
+        self._intro_iter = iter(self._title_ramp)
+        self._intro_job = self.root.after(500, self._pulse_title)
+    
+    def _pulse_title(self):
+        """Advance the intro animation by one color"""
+        color = next(self._intro_iter, None)
+        if color is None:
+            self._intro_job = None
+            self.title_label.config(fg=Theme.ACCENT_PRIMARY)
+            return
+        self.title_label.config(fg=color)
+        self._intro_job = self.root.after(50, self._pulse_title)
     
     def _blend_color(self, c1, c2, alpha):
         """Blend two colors"""
-        r1 = int(c1[1:3], 16)
-        g1 = int(c1[3:5], 16)
-        b1 = int(c1[5:7], 16)
-        
-        r2 = int(c2[1:3], 16)
-        g2 = int(c2[3:5], 16)
-        b2 = int(c2[5:7], 16)
+        v1 = int(c1[1:], 16)
+        v2 = int(c2[1:], 16)
+        r1, g1, b1 = v1 >> 16, (v1 >> 8) & 0xff, v1 & 0xff
+        r2, g2, b2 = v2 >> 16, (v2 >> 8) & 0xff, v2 & 0xff
         
         r = int(r1 + (r2 - r1) * alpha)
         g = int(g1 + (g2 - g1) * alpha)
@@ -927,56 +1174,119 @@ class PAUVFApp:
     
     def _process_file(self, file_path):
         """Process the selected APK file"""
+        self._cancel_animations()
         filename = os.path.basename(file_path)
         self.file_label.config(text=filename, fg=Theme.TEXT_PRIMARY)
         self.file_icon.config(text="📱")
         
         self.result_label.config(text="")
         self.details_label.config(text="")
-        self.status_label.config(text="Starting analysis...")
+        self._status_var.set("Starting analysis...")
         self.current_file_label.config(text="")
-        self.progress_percent_label.config(text="0%")
+        self._pct_var.set(self.PERCENT_STR[0])
         self.progress_bar.set_progress(0, animate=False)
+        
+        self._stop_scan_process()
+        scan = self._scan = _ScanState()
+        try:
+            use_process = os.path.getsize(file_path) >= self.PROCESS_SCAN_MIN_SIZE
+        except OSError:
+            use_process = False
+        if use_process:
+            self._progress_queue = self._mp_context.Queue()
+            self._result_queue = self._mp_context.Queue()
+            self._scan_process = self._mp_context.Process(
+                target=_scan_in_worker,
+                args=(file_path, self._progress_queue, self._result_queue),
+                daemon=True
+            )
+            self._scan_process.start()
+            return
+        
         def extract():
             def update_status(message, progress, file_name=None):
-                """Update UI with detailed progress"""
-                def update():
-                    self.status_label.config(text=message)
-                    self.progress_bar.set_progress(progress)
-                    self.progress_percent_label.config(text=f"{int(progress)}%")
-                    if file_name:
-                        self.current_file_label.config(text=f"└─ {file_name}")
-                    else:
-                        self.current_file_label.config(text="")
-                
-                self.root.after(0, update)
+                """Publish the latest progress for _drain_status to pick up"""
+                scan.status = (message, progress, file_name)
             
-            result = UnityVersionExtractor.extract_version(file_path, update_status)
-            self.root.after(0, lambda: self._show_result(result))
+            scan.result = UnityVersionExtractor.extract_version(file_path, _throttled(update_status))
         
         thread = threading.Thread(target=extract, daemon=True)
         thread.start()
     
+    def _stop_scan_process(self):
+        """Terminate the worker process of an unfinished scan, if any"""
+        if self._scan_process is not None:
+            if self._scan_process.is_alive():
+                self._scan_process.terminate()
+            self._scan_process = None
+            self._progress_queue = None
+            self._result_queue = None
+    
+    def _poll_scan_process(self, scan):
+        """Move worker process progress into the scan's status slot and return its result once done"""
+        try:
+            while True:
+                scan.status = self._progress_queue.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            result = self._result_queue.get_nowait()
+        except queue.Empty:
+            if self._scan_process.is_alive():
+                return None
+            try:
+                # The worker may have put its result just before exiting
+                result = self._result_queue.get(timeout=0.1)
+            except queue.Empty:
+                result = UnityVersionExtractor.empty_result()
+                result['error'] = f"Unexpected error: scan process exited with code {self._scan_process.exitcode}"
+        self._stop_scan_process()
+        return result
+    
+    def _drain_status(self):
+        """Apply the most recent worker progress update and any finished result, at most once per 50 ms"""
+        scan = self._scan
+        if scan is not None:
+            result = self._poll_scan_process(scan) if self._scan_process is not None else scan.result
+            status = scan.status
+            # The status slot is never cleared; the last applied tuple is skipped instead
+            if status is not None and status is not self._applied_status:
+                self._applied_status = status
+                message, progress, file_name = status
+                self._status_set(message)
+                self._progress_set(progress)
+                self._percent_set(self.PERCENT_STR[int(progress)])
+                if file_name:
+                    self._current_config(text=f"└─ {file_name}")
+                else:
+                    self._current_config(text="")
+            if result is not None:
+                self._scan = None
+                self._show_result(result)
+        
+        self.root.after(50, self._drain_status)
+    
     def _show_result(self, result):
         self.current_file_label.config(text="")
         self.progress_bar.set_progress(100)
-        self.progress_percent_label.config(text="100%")
+        self._pct_var.set(self.PERCENT_STR[100])
         
         if result['success']:
             self.file_icon.config(text="✅")
-            self.status_label.config(text="✨ Unity version found!", fg=Theme.ACCENT_PRIMARY)
+            self._status_var.set("✨ Unity version found!")
+            self.status_label.config(fg=Theme.ACCENT_PRIMARY)
             
             version_text = f"Unity {result['version']}"
             self.result_label.config(text=version_text, fg=Theme.ACCENT_PRIMARY)
             
-            if result['source_file']:
-                source = os.path.basename(result['source_file'])
-                self.details_label.config(text=f"📄 Found in: {source}")
+            if result['source_name']:
+                self.details_label.config(text=f"📄 Found in: {result['source_name']}")
             self._animate_result()
             
         elif result['is_unity'] and not result['success']:
             self.file_icon.config(text="⚠️")
-            self.status_label.config(text="⚠️ Unity game detected", fg=Theme.TEXT_SECONDARY)
+            self._status_var.set("⚠️ Unity game detected")
+            self.status_label.config(fg=Theme.TEXT_SECONDARY)
             self.result_label.config(
                 text="Version Unknown",
                 fg=Theme.TEXT_SECONDARY
@@ -986,7 +1296,8 @@ class PAUVFApp:
             )
         else:
             self.file_icon.config(text="❌")
-            self.status_label.config(text="❌ Analysis complete", fg=Theme.TEXT_MUTED)
+            self._status_var.set("❌ Analysis complete")
+            self.status_label.config(fg=Theme.TEXT_MUTED)
             self.result_label.config(
                 text="Not a Unity Game",
                 fg="#ff6b6b"
@@ -997,22 +1308,35 @@ class PAUVFApp:
     
     def _animate_result(self):
         """Animate the result display"""
-        original_color = Theme.ACCENT_PRIMARY
-        flash_color = "#ffffff"
-        
-        def flash(step=0):
-            if step < 6:
-                color = flash_color if step % 2 == 0 else original_color
-                self.result_label.config(fg=color)
-                self.root.after(100, lambda: flash(step + 1))
-            else:
-                self.result_label.config(fg=original_color)
-        
-        flash()
+        self._cancel_animations()
+        self._flash_iter = iter(self.RESULT_FLASH)
+        self._flash_result()
+    
+    def _flash_result(self):
+        """Advance the result flash by one color"""
+        color = next(self._flash_iter, None)
+        if color is None:
+            self._flash_job = None
+            self.result_label.config(fg=Theme.ACCENT_PRIMARY)
+            return
+        self.result_label.config(fg=color)
+        self._flash_job = self.root.after(100, self._flash_result)
+    
+    def _cancel_animations(self):
+        """Stop the intro and result animations if they are still running"""
+        if self._intro_job is not None:
+            self.root.after_cancel(self._intro_job)
+            self._intro_job = None
+            self.title_label.config(fg=Theme.ACCENT_PRIMARY)
+        if self._flash_job is not None:
+            self.root.after_cancel(self._flash_job)
+            self._flash_job = None
     
     def run(self):
         """Start the application"""
         self.root.mainloop()
+        self._stop_scan_process()
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     app = PAUVFApp()
     app.run()